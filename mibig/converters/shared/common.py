@@ -3,6 +3,7 @@ import datetime
 from enum import Enum
 from functools import total_ordering
 import re
+import sys
 from typing import Any, Self
 
 from mibig.errors import ValidationError
@@ -118,6 +119,8 @@ class Location:
 class NovelGeneId:
     _inner: str
 
+    __slots__ = ("_inner",)
+
     def __init__(self, inner: str, validate: bool = True, **kwargs) -> None:
         self._inner = inner
 
@@ -174,22 +177,38 @@ class NovelGeneId:
 
 
 class GeneId(NovelGeneId):
+    __slots__ = ()
+
     def validate(
         self, record: Record | None = None, **kwargs
     ) -> list[ValidationErrorInfo]:
+        # the same gene id is validated once per module referencing it, so a
+        # top-level validate call shares a memo through its kwargs; scoping the
+        # memo to one call keeps results from leaking between records or loads
+        memo: dict | None = kwargs.get("_validate_memo")
+        key = (self._inner, kwargs.get("quality"))
+        if memo is not None:
+            cached = memo.get(key)
+            if cached is not None:
+                return list(cached)
+
         errors = super().validate(**kwargs)
 
-        if record and not record.get_cds(self._inner):
+        if record and not record.has_cds(self._inner):
             errors.append(
                 ValidationErrorInfo(
                     "gene_id", f"Gene id {self._inner!r} not found in record"
                 )
             )
 
+        if memo is not None:
+            memo[key] = errors
+            return list(errors)
         return errors
 
 
 _UNIQUE_CITATIONS = {}  # for single-instance tracking, making numerical identifiers easier to manage
+_VALIDATED_CITATIONS: dict[tuple[str, str], list[ValidationErrorInfo]] = {}  # validation outcome per unique citation
 
 @total_ordering
 class Citation:
@@ -202,6 +221,8 @@ class Citation:
     database: str
     value: str
 
+    __slots__ = ("database", "value", "short_id")
+
     def __new__(cls, database: str, value: str, validate: bool = True, short_id: str = "") -> None:
         instance = _UNIQUE_CITATIONS.get((database, value))
         if not instance:
@@ -243,21 +264,26 @@ class Citation:
         return cls(database, value)
 
     def validate(self) -> list[ValidationErrorInfo]:
-        if self.database not in self.VALID_PATTERNS.keys():
-            return [
-                ValidationErrorInfo(
-                    "citation", f"Invalid database type {self.database!r}"
-                )
-            ]
-
-        if not re.match(self.VALID_PATTERNS[self.database], self.value):
-            return [
-                ValidationErrorInfo(
-                    "citation",
-                    f"Invalid value {self.value!r} for database {self.database!r}",
-                )
-            ]
-        return []
+        key = (self.database, self.value)
+        errors = _VALIDATED_CITATIONS.get(key)
+        if errors is None:
+            if self.database not in self.VALID_PATTERNS.keys():
+                errors = [
+                    ValidationErrorInfo(
+                        "citation", f"Invalid database type {self.database!r}"
+                    )
+                ]
+            elif not re.match(self.VALID_PATTERNS[self.database], self.value):
+                errors = [
+                    ValidationErrorInfo(
+                        "citation",
+                        f"Invalid value {self.value!r} for database {self.database!r}",
+                    )
+                ]
+            else:
+                errors = []
+            _VALIDATED_CITATIONS[key] = errors
+        return list(errors)
 
     def __lt__(self, other: Self) -> bool:
         return (self.database, self.value) < (other.database, other.value)
@@ -278,6 +304,8 @@ class Evidence:
     method: str
     references: list[Citation]
 
+    __slots__ = ("method", "references")
+
     VALID_METHODS = {
         "Sequence-based prediction",
     }
@@ -293,7 +321,7 @@ class Evidence:
         if errors:
             raise ValidationError(errors)
 
-    def validate(self, quality: QualityLevel | None = None) -> list[ValidationErrorInfo]:
+    def validate(self, quality: QualityLevel | None = None, **kwargs) -> list[ValidationErrorInfo]:
         errors: list[ValidationErrorInfo] = []
 
         if self.method not in self.VALID_METHODS:
@@ -320,7 +348,8 @@ class Evidence:
 
     @classmethod
     def from_json(cls, raw: dict[str, Any], **kwargs) -> Self:
-        method = raw["method"]
+        # the handful of valid methods repeat across the whole corpus, share the storage
+        method = sys.intern(raw["method"])
         references = [Citation.from_json(r) for r in raw.get("references", [])]
         return cls(method, references, **kwargs)
 
@@ -1,4 +1,8 @@
 from .common import Locus as Locus, Taxonomy as Taxonomy
 from .compound import Compound as Compound
-from .entry import MibigEntry as MibigEntry
+from .entry import (
+    MibigEntry as MibigEntry,
+    load_entry as load_entry,
+    load_entry_json as load_entry_json,
+)
 
@@ -33,6 +33,11 @@ MAPPING: dict[SynthesisType, type[ExtraInfo]] = {
     SynthesisType.OTHER: Other,
 }
 
+# string-keyed registries built once at import time so from_json() can dispatch
+# without constructing the enum member twice per class
+_SYNTHESIS_TYPE_BY_VALUE = {synthesis_type.value: synthesis_type for synthesis_type in SynthesisType}
+_CLASS_BY_VALUE = {synthesis_type.value: info_class for synthesis_type, info_class in MAPPING.items()}
+
 
 class BiosynthesisClass:
     class_name: SynthesisType
@@ -68,10 +73,14 @@ class BiosynthesisClass:
     @classmethod
     def from_json(cls, raw: dict[str, Any], **kwargs) -> Self:
         class_name = raw["class"]
-        extra_info = MAPPING[SynthesisType(class_name)].from_json(raw, **kwargs)
+        synthesis_type = _SYNTHESIS_TYPE_BY_VALUE.get(class_name)
+        if synthesis_type is None:
+            # unknown class, let the enum constructor raise the usual ValueError
+            synthesis_type = SynthesisType(class_name)
+        extra_info = _CLASS_BY_VALUE[class_name].from_json(raw, **kwargs)
 
         return cls(
-            class_name=SynthesisType(class_name),
+            class_name=synthesis_type,
             extra_info=extra_info,
             **kwargs,
         )
@@ -12,6 +12,8 @@ class Monomer:
     structure: Smiles
     references: list[Citation]
 
+    __slots__ = ("name", "structure", "references")
+
     def __init__(self, name: str, structure: Smiles, references: list[Citation], validate: bool = True):
         self.name = name
         self.structure = structure
@@ -55,7 +57,7 @@ class ReleaseType:
     details: str | None
     references: list[Citation]
 
-    VALID_RELEASE_TYPES = (
+    VALID_RELEASE_TYPES = frozenset({
         "Claisen condensation",
         "Hydrolysis",
         "Macrolactamization",
@@ -63,7 +65,7 @@ class ReleaseType:
         "None",
         "Other",
         "Reductive release",
-    )
+    })
 
     def __init__(self, name: str, references: list[Citation], details: str | None = None, validate: bool = True, **kwargs):
         self.name = name
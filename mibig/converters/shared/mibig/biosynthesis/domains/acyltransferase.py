@@ -10,14 +10,14 @@ from .core import DomainInfo, Substrate
 class ATSubstrate(Substrate):
     details: str | None = None
 
-    VALID_NAMES = (
+    VALID_NAMES = frozenset({
         "acetyl-CoA",
         "malonyl-CoA",
         "methylmalonyl-CoA",
         "ethylmalonyl-CoA",
         "methoxymalonyl-CoA",
         "other",
-    )
+    })
 
     def __init__(
         self,
@@ -73,10 +73,10 @@ class Acyltransferase(DomainInfo):
     evidence: list[SubstrateEvidence]
     inactive: bool | None = None
 
-    VALID_SUBTYPES = (
+    VALID_SUBTYPES = frozenset({
         "cis-AT",
         "trans-AT",
-    )
+    })
 
     def __init__(
         self,
@@ -77,6 +77,11 @@ MAPPING: dict[DomainType, type[ExtraInfo]] = {
     DomainType.THIOREDUCTASE: Thioreductase,
 }
 
+# string-keyed registries built once at import time so from_json() can dispatch
+# without constructing the enum member for every domain
+_DOMAIN_TYPE_BY_VALUE = {domain_type.value: domain_type for domain_type in DomainType}
+_CLASS_BY_VALUE = {domain_type.value: info_class for domain_type, info_class in MAPPING.items()}
+
 
 class Domain:
     domain_type: DomainType
@@ -131,9 +136,13 @@ class Domain:
 
     @classmethod
     def from_json(cls, raw: dict[str, Any], **kwargs) -> Self:
-        domain_type = DomainType(raw["type"])
+        raw_type = raw["type"]
+        domain_type = _DOMAIN_TYPE_BY_VALUE.get(raw_type)
+        if domain_type is None:
+            # unknown type, let the enum constructor raise the usual ValueError
+            domain_type = DomainType(raw_type)
 
-        extra_info = MAPPING[domain_type].from_json(raw, **kwargs)
+        extra_info = _CLASS_BY_VALUE[raw_type].from_json(raw, **kwargs)
 
         return cls(
             domain_type=domain_type,
@@ -6,10 +6,10 @@ from .core import DomainInfo
 class Carrier(DomainInfo):
     beta_branching: bool | None
 
-    VALID_SUBTYPES = (
+    VALID_SUBTYPES = frozenset({
         "ACP",
         "PCP",
-    )
+    })
 
     def __init__(self, subtype: str | None = None, beta_branching: bool | None = None, **kwargs) -> None:
         self.beta_branching = beta_branching
@@ -6,14 +6,14 @@ from .core import DomainInfo
 
 
 class Condensation(DomainInfo):
-    VALID_SUBTYPES = (
+    VALID_SUBTYPES = frozenset({
         "Dual",
         "Starter",
         "LCL",
         "DCL",
         "Ester bond-forming",
         "Heterocyclization",
-    )
+    })
 
     def validate(self, **kwargs) -> list[ValidationErrorInfo]:
         errors = []
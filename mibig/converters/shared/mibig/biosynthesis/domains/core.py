@@ -61,7 +61,7 @@ class DomainInfo:
     evidence: list[Evidence]
     substrates: list[Substrate]
 
-    VALID_SUBTYPES: tuple[str, ...] = tuple()
+    VALID_SUBTYPES: frozenset[str] = frozenset()
 
     def __init__(
         self, *,
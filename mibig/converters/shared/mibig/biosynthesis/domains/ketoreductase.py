@@ -10,7 +10,7 @@ from .core import ActiveDomain
 class Ketoreductase(ActiveDomain):
     stereochemistry: str | None
 
-    VALID_STEREOCHEMISTRY = (
+    VALID_STEREOCHEMISTRY = frozenset({
         "A",
         "B",
         "A1",
@@ -19,7 +19,7 @@ class Ketoreductase(ActiveDomain):
         "B2",
         "C1",
         "C2",
-    )
+    })
 
     def __init__(
         self,
@@ -8,12 +8,12 @@ from .core import DomainInfo
 class Methyltransferase(DomainInfo):
     details: str | None
 
-    VALID_SUBTYPES = (
+    VALID_SUBTYPES = frozenset({
         'C',
         'N',
         'O',
         'other',
-    )
+    })
 
     def __init__(self, subtype: str | None = None, details: str | None = None, **kwargs):
         self.details = details
@@ -2,7 +2,7 @@ from .core import DomainInfo
 
 
 class Thioesterase(DomainInfo):
-    VALID_SUBTYPES = (
+    VALID_SUBTYPES = frozenset({
         'Type I',
         'Type II',
-    )
+    })
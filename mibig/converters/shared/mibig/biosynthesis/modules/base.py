@@ -1,5 +1,5 @@
 from enum import StrEnum
-from typing import Any, Self
+from typing import Any, Iterator, Self
 
 from mibig.converters.shared.common import (
     Citation,
@@ -26,18 +26,22 @@ ExtraInfo = ModuleInfo
 
 
 class NcaEvidence(Evidence):
-    VALID_METHODS = (
+    __slots__ = ()
+
+    VALID_METHODS = frozenset({
         "Sequence-based prediction",
         "Structure-based inference",
         "Activity assay",
-    )
+    })
 
 
 class NonCanonicalActivity:
     evidence: list[NcaEvidence]
-    iterations: int | None = None
-    non_elongating: bool | None = None
-    skipped: bool | None = None
+    iterations: int | None
+    non_elongating: bool | None
+    skipped: bool | None
+
+    __slots__ = ("evidence", "iterations", "non_elongating", "skipped")
 
     def __init__(
         self,
@@ -61,27 +65,27 @@ class NonCanonicalActivity:
             raise ValidationError(errors)
 
     def validate(self, **kwargs) -> list[ValidationErrorInfo]:
-        errors = []
+        return list(self._iter_errors(**kwargs))
 
+    def _iter_errors(self, **kwargs) -> Iterator[ValidationErrorInfo]:
         quality: QualityLevel | None = kwargs.get("quality")
 
         if quality != QualityLevel.QUESTIONABLE:
             if not self.evidence:
-                errors.append(
-                    ValidationErrorInfo(
-                        "NonCanonicalActivity.evidence",
-                        "At least one evidence must be provided",
-                    )
+                yield ValidationErrorInfo(
+                    "NonCanonicalActivity.evidence",
+                    "At least one evidence must be provided",
                 )
         for evidence in self.evidence:
-            errors.extend(evidence.validate(**kwargs))
-
-        return errors
+            yield from evidence.validate(**kwargs)
 
     @classmethod
     def from_json(cls, raw: dict[str, Any], **kwargs) -> Self:
+        # the evidence is covered by this object's own validation, so don't validate it twice
+        child_kwargs = dict(kwargs)
+        child_kwargs["validate"] = False
         return cls(
-            evidence=[NcaEvidence.from_json(evidence, **kwargs) for evidence in raw["evidence"]],
+            evidence=[NcaEvidence.from_json(evidence, **child_kwargs) for evidence in raw["evidence"]],
             iterations=raw.get("iterations"),
             non_elongating=raw.get("nonElongating"),
             skipped=raw.get("skipped"),
@@ -125,6 +129,11 @@ MAPPING = {
     ModuleType.PKS_TRANS_AT_STARTER: PksTransAtStarter,
 }
 
+# resolved by raw string once at import time so from_json() doesn't need to run
+# the enum constructor twice per module
+_MODULE_TYPE_BY_VALUE = {module_type.value: module_type for module_type in ModuleType}
+_CLASS_BY_VALUE = {module_type.value: info_class for module_type, info_class in MAPPING.items()}
+
 
 class Module:
     module_type: ModuleType
@@ -136,6 +145,18 @@ class Module:
     non_canonical_activity: NonCanonicalActivity | None
     comment: str | None
 
+    __slots__ = (
+        "module_type",
+        "name",
+        "genes",
+        "active",
+        "extra_info",
+        "integrated_monomers",
+        "non_canonical_activity",
+        "comment",
+        "_references",
+    )
+
     def __init__(
         self,
         module_type: ModuleType,
@@ -157,6 +178,7 @@ class Module:
         self.integrated_monomers = integrated_monomers
         self.non_canonical_activity = non_canonical_activity
         self.comment = comment
+        self._references = None
 
         if not validate:
             return
@@ -166,42 +188,52 @@ class Module:
             raise ValidationError(errors)
 
     def validate(self, **kwargs) -> list[ValidationErrorInfo]:
-        errors = []
+        return list(self._iter_errors(**kwargs))
 
-        errors.extend(self.extra_info.validate(**kwargs))
+    def _iter_errors(self, **kwargs) -> Iterator[ValidationErrorInfo]:
+        yield from self.extra_info.validate(**kwargs)
 
         for monomer in self.integrated_monomers:
-            errors.extend(monomer.validate())
+            yield from monomer.validate()
 
         for gene in self.genes:
-            errors.extend(gene.validate(record=kwargs.get("record")))
+            yield from gene.validate(**kwargs)
 
         if self.non_canonical_activity:
-            errors.extend(self.non_canonical_activity.validate(**kwargs))
-
-        return errors
+            yield from self.non_canonical_activity._iter_errors(**kwargs)
 
     @property
     def references(self) -> list[Citation]:
-        references = set()
-        for monomer in self.integrated_monomers:
-            references.update(monomer.references)
-        for domain in self.extra_info.get_domains():
-            references.update(domain.references)
-        return sorted(list(references))
+        # cached_property needs an instance dict, so cache in a slot by hand
+        if self._references is None:
+            references = set()
+            for monomer in self.integrated_monomers:
+                references.update(monomer.references)
+            for domain in self.extra_info.get_domains():
+                references.update(domain.references)
+            self._references = sorted(references)
+        return self._references
 
     @classmethod
     def from_json(cls, raw: dict[str, Any], **kwargs) -> Self:
-        module_type = ModuleType(raw["type"])
-        extra_info = MAPPING[ModuleType(module_type)].from_json(raw, **kwargs)
+        raw_type = raw["type"]
+        module_type = _MODULE_TYPE_BY_VALUE.get(raw_type)
+        if module_type is None:
+            # unknown type, let the enum constructor raise the usual ValueError
+            module_type = ModuleType(raw_type)
+        extra_info = _CLASS_BY_VALUE[raw_type].from_json(raw, **kwargs)
+        # genes and the non-canonical activity are validated again by the module itself,
+        # so skip the extra validation pass while building them
+        child_kwargs = dict(kwargs)
+        child_kwargs["validate"] = False
         nc_activity = None
         if raw.get("non_canonical_activity"):
-            nc_activity = NonCanonicalActivity.from_json(raw["non_canonical_activity"], **kwargs)
+            nc_activity = NonCanonicalActivity.from_json(raw["non_canonical_activity"], **child_kwargs)
 
         return cls(
             module_type=module_type,
             name=raw["name"],
-            genes=[GeneId.from_json(gene, **kwargs) for gene in raw["genes"]],
+            genes=[GeneId.from_json(gene, **child_kwargs) for gene in raw["genes"]],
             active=raw["active"],
             extra_info=extra_info,
             comment=raw.get("comment"),
@@ -225,10 +257,8 @@ class Module:
             ret["integrated_monomers"] = [
                 monomer.to_json() for monomer in self.integrated_monomers
             ]
-
-        if self.non_canonical_activity:
+        if self.non_canonical_activity is not None:
             ret["non_canonical_activity"] = self.non_canonical_activity.to_json()
-
         if self.comment:
             ret["comment"] = self.comment
 
@@ -14,6 +14,8 @@ class CompletenessLevel(Enum):
 
 
 class SubstrateEvidence(Evidence):
+    __slots__ = ()
+
     VALID_METHODS = {
         "Activity assay",
         "ACVS assay",
@@ -36,6 +38,8 @@ class SubstrateEvidence(Evidence):
 
 
 class LocusEvidence(Evidence):
+    __slots__ = ()
+
     VALID_METHODS = {
         "Homology-based prediction",
         "Correlation of genomic and metabolomic data",
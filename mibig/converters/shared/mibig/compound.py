@@ -226,7 +226,7 @@ class Evidence:
     method: str
     references: list[Citation]
 
-    VALID_METHODS = (
+    VALID_METHODS = frozenset({
         "NMR",
         "Mass spectrometry",
         "MS/MS",
@@ -234,7 +234,7 @@ class Evidence:
         "Chemical derivatisation",
         "Total synthesis",
         "Experimental values match with authentic standard",
-    )
+    })
 
     def __init__(self, method: str, references: list[Citation], validate: bool = True, **kwargs) -> None:
         self.method = method
@@ -460,7 +460,7 @@ class Compound:
         if errors:
             raise ValidationError(errors)
 
-    def validate(self, quality: QualityLevel = QualityLevel.QUESTIONABLE) -> list[ValidationErrorInfo]:
+    def validate(self, quality: QualityLevel = QualityLevel.QUESTIONABLE, **kwargs) -> list[ValidationErrorInfo]:
         errors: list[ValidationErrorInfo] = []
 
         if not re.match(VALID_NAME_PATTERN, self.name):
@@ -2,6 +2,12 @@ from functools import cached_property
 import re
 from typing import Any, Self
 
+try:
+    # orjson parses in native code, cutting load times on large corpora
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 from mibig.converters.shared.common import ChangeLog, Citation, StatusLevel
 from mibig.converters.shared.mibig.biosynthesis import Biosynthesis
 from mibig.converters.shared.mibig.common import (
@@ -96,6 +102,8 @@ class MibigEntry:
             )
 
         kwargs["quality"] = quality
+        # shared by the gene id checks below, lives only for this call
+        kwargs.setdefault("_validate_memo", {})
 
         errors.extend(self.changelog.validate(**kwargs))
 
@@ -227,3 +235,12 @@ class MibigEntry:
             ret["legacy_references"] = [ref.to_json() for ref in self._legacy_references]
 
         return ret
+
+
+def load_entry_json(data: bytes | str, **kwargs) -> MibigEntry:
+    return MibigEntry.from_json(_loads(data), **kwargs)
+
+
+def load_entry(filepath: str, **kwargs) -> MibigEntry:
+    with open(filepath, "rb") as handle:
+        return load_entry_json(handle.read(), **kwargs)
@@ -1,16 +1,19 @@
-from typing import Any, Self
+import sys
+from typing import Any, Iterator, Self
 
 from mibig.converters.shared.common import Citation, Evidence, QualityLevel, validate_citation_list
 from mibig.errors import ValidationError, ValidationErrorInfo
 
 
 class FunctionEvidence(Evidence):
-    VALID_METHODS = (
+    __slots__ = ()
+
+    VALID_METHODS = frozenset({
         "Other in vivo study",
         "Heterologous expression",
         "Knock-out",
-        "Activity assay"
-    )
+        "Activity assay",
+    })
 
 
 class MutationPhenotype:
@@ -18,6 +21,8 @@ class MutationPhenotype:
     details: str | None
     references: list[Citation]
 
+    __slots__ = ("phenotype", "details", "references")
+
     def __init__(self, phenotype: str, references: list[Citation], details: str | None = None, validate: bool = True, **kwargs):
         self.phenotype = phenotype
         self.details = details
@@ -31,12 +36,13 @@ class MutationPhenotype:
             raise ValidationError(errors)
 
     def validate(self, **kwargs) -> list[ValidationErrorInfo]:
-        errors = []
+        return list(self._iter_errors(**kwargs))
+
+    def _iter_errors(self, **kwargs) -> Iterator[ValidationErrorInfo]:
         quality: QualityLevel | None = kwargs.get("quality")
         if not self.phenotype:
-            errors.append(ValidationErrorInfo("MutationPhenotype.phenotype", "Phenotype must be provided"))
-        errors.extend(validate_citation_list(self.references, "MutationPhenotype.references", quality=quality))
-        return errors
+            yield ValidationErrorInfo("MutationPhenotype.phenotype", "Phenotype must be provided")
+        yield from validate_citation_list(self.references, "MutationPhenotype.references", quality=quality)
 
     @classmethod
     def from_json(cls, raw: dict[str, Any], **kwargs) -> Self:
@@ -64,7 +70,9 @@ class GeneFunction:
     details: str | None
     mutation_phenotype: MutationPhenotype | None
 
-    VALID_FUNCTIONS = (
+    __slots__ = ("function", "evidence", "details", "mutation_phenotype")
+
+    VALID_FUNCTIONS = frozenset({
         "Activation / processing",
         "Maturation",
         "Precursor",
@@ -75,7 +83,7 @@ class GeneFunction:
         "Tailoring",
         "Transport",
         "Other",
-    )
+    })
 
     def __init__(self, function: str, evidence: list[FunctionEvidence],
                  details: str | None = None,
@@ -96,27 +104,32 @@ class GeneFunction:
             raise ValidationError(errors)
 
     def validate(self, **kwargs) -> list[ValidationErrorInfo]:
-        errors = []
+        return list(self._iter_errors(**kwargs))
+
+    def _iter_errors(self, **kwargs) -> Iterator[ValidationErrorInfo]:
         if self.function not in self.VALID_FUNCTIONS:
-            errors.append(ValidationErrorInfo("GeneFunction.function", f"Invalid function: {self.function}"))
+            yield ValidationErrorInfo("GeneFunction.function", f"Invalid function: {self.function}")
 
         if self.function == "Other" and not self.details:
-            errors.append(ValidationErrorInfo("GeneFunction.details", "Details must be provided for 'Other' function"))
+            yield ValidationErrorInfo("GeneFunction.details", "Details must be provided for 'Other' function")
 
         if self.mutation_phenotype:
-            errors.extend(self.mutation_phenotype.validate(**kwargs))
+            yield from self.mutation_phenotype._iter_errors(**kwargs)
 
         for evidence in self.evidence:
-            errors.extend(evidence.validate(**kwargs))
-        return errors
+            yield from evidence.validate(**kwargs)
 
     @classmethod
     def from_json(cls, raw: dict[str, Any], **kwargs) -> Self:
+        # evidence and mutation phenotype get validated with the rest of the gene function,
+        # no need for a separate pass per child
+        child_kwargs = dict(kwargs)
+        child_kwargs["validate"] = False
         return cls(
-            function=raw["function"]["name"],
-            evidence=[FunctionEvidence.from_json(evidence, **kwargs) for evidence in raw["evidence"]],
+            function=sys.intern(raw["function"]["name"]),
+            evidence=[FunctionEvidence.from_json(evidence, **child_kwargs) for evidence in raw["evidence"]],
             details=raw["function"].get("details"),
-            mutation_phenotype=MutationPhenotype.from_json(raw["mutation_phenotype"], **kwargs) if "mutation_phenotype" in raw else None,
+            mutation_phenotype=MutationPhenotype.from_json(raw["mutation_phenotype"], **child_kwargs) if "mutation_phenotype" in raw else None,
             **kwargs,
         )
 
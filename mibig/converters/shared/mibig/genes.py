@@ -39,7 +39,7 @@ class GeneLocation:
             )
         for exon in self.exons:
             errors.extend(exon.validate(**kwargs))
-        if self.strand not in [-1, 1]:
+        if self.strand not in (-1, 1):
             errors.append(
                 ValidationErrorInfo("strand", "Strand must be either -1 or 1")
             )
@@ -62,7 +62,7 @@ class Addition:
     location: GeneLocation
     translation: str | None
 
-    VALID_AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+    VALID_AMINO_ACIDS = frozenset("ACDEFGHIKLMNPQRSTVWY")
 
     def __init__(
         self,
@@ -163,7 +163,7 @@ class TailoringFunction:
     db_reference: str | None
     details: str | None
 
-    VALID_FUNCTIONS = (
+    VALID_FUNCTIONS = frozenset({
         "Acetylation",
         "Acylation",
         "Amination",
@@ -192,7 +192,7 @@ class TailoringFunction:
         "Reduction",
         "Sulfation",
         "Other",
-    )
+    })
     REFERENCE_PATTERN = r"^mite:MITE\d{7,7}$"
 
     def __init__(
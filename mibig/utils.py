@@ -1,118 +1,115 @@
+from dataclasses import dataclass, field
+import logging
 import re
-from typing import Self
-
-from Bio.SeqRecord import SeqRecord
-from helperlibs.bio import seqio
+import sys
+from typing import TYPE_CHECKING, Self
 
 from mibig.errors import MibigError
-import utils_modules
+
+if TYPE_CHECKING:
+    from Bio.SeqRecord import SeqRecord
+
+    from mibig.utils_modules import aSModule
+
+logger = logging.getLogger(__name__)
 
 INVALID_CHARS = re.compile(r"[!?,;:=+*&^%$#@ \t\n\r\\\/\[\]{}()<>|~`'\"]")
+# same character set as INVALID_CHARS, but as a deletion table so sanitising
+# doesn't need to spin up the regex engine per identifier
+_INVALID_CHARS_TABLE = str.maketrans("", "", "!?,;:=+*&^%$#@ \t\n\r\\/[]{}()<>|~`'\"")
+
+
+_NO_QUALIFIER = (None,)
+
+
+def _first(qualifiers: dict, key: str):
+    # shared default so grabbing an absent qualifier doesn't allocate a fresh list
+    return qualifiers.get(key, _NO_QUALIFIER)[0]
 
 
 def _sanitise_identifier(identifier: str | None) -> str | None:
     if not identifier:
         return None
 
-    return INVALID_CHARS.sub("", identifier)
+    return identifier.translate(_INVALID_CHARS_TABLE)
 
 
+@dataclass(slots=True, eq=False)
 class CDS:
-    _locus_tag: str | None
-    _gene: str | None
-    _protein_id: str | None
-    _translation: str | None
-    _translation_length: int = 0
-
-    def __init__(self, locus_tag: str = None, gene: str = None, protein_id: str = None, \
-                 translation: str = None, nrps_pks: str = None, product: str = None, \
-                    location: list[int] | None = None) -> None:
-
-        if not any([locus_tag, gene, protein_id]):
+    locus_tag: str | None = None
+    gene: str | None = None
+    protein_id: str | None = None
+    translation: str | None = None
+    #### By DomML
+    nrps_pks: str | None = None
+    product: str | None = None
+    location: tuple[int, int] | None = None
+
+    def __post_init__(self) -> None:
+        if not any([self.locus_tag, self.gene, self.protein_id]):
             raise MibigError("At least one of locus_tag, gene, or protein_id is required")
-        
-        if not (location is None or len(location) == 2):
+
+        if not (self.location is None or len(self.location) == 2):
             raise MibigError("Location should be a list of two integers")
 
-        self._locus_tag = _sanitise_identifier(locus_tag)
-        self._gene = _sanitise_identifier(gene)
-        self._protein_id = _sanitise_identifier(protein_id)
-        self.translation = translation
-        #### By DomML
-        self.nrps_pks = nrps_pks
-        self.product = product
-        self.location = location
+        if self.location is not None:
+            self.location = tuple(self.location)
+
+        self.locus_tag = _sanitise_identifier(self.locus_tag)
+        self.gene = _sanitise_identifier(self.gene)
+        self.protein_id = _sanitise_identifier(self.protein_id)
+        if self.locus_tag is not None:
+            # locus tags get repeated by every module and gene annotation referencing them
+            self.locus_tag = sys.intern(self.locus_tag)
 
     @property
     def name(self) -> str:
         # make the type checker happy
-        name = self._locus_tag or self._gene or self._protein_id
+        name = self.locus_tag or self.gene or self.protein_id
         assert name
         return name
 
     def has_name(self, name: str) -> bool:
-        return name in [self._locus_tag, self._gene, self._protein_id]
+        return name in (self.locus_tag, self.gene, self.protein_id)
 
     @property
     def translation_length(self) -> int:
-        return self._translation_length
-
-    @property
-    def translation(self) -> str | None:
-        return self._translation
-
-    @translation.setter
-    def translation(self, translation: str | None) -> None:
-        self._translation = translation
-        if not translation:
-            return
-
-        self._translation_length = len(translation)
+        return len(self.translation) if self.translation else 0
 
 
+@dataclass(slots=True, eq=False)
 class Record:
     id: str
     cdses: list[CDS]
     seq_len: int
-    ncbi_tax_id: int | None
-    organism: str | None
-    _cds_by_locus: dict[str, CDS]
-    _cds_by_gene: dict[str, CDS]
-    _cds_by_protein: dict[str, CDS]
-
-    def __init__(self, id: str, cdses: list[CDS], seq_len: int, ncbi_tax_id: int | None = None, organism: str | None = None) -> None:
-        self.id = id
-        self.cdses = cdses
-        self.seq_len = seq_len
-        self.ncbi_tax_id = ncbi_tax_id
-        self.organism = organism
-
-        self._cds_by_locus = {}
-        self._cds_by_gene = {}
-        self._cds_by_protein = {}
-        for cds in cdses:
-            if cds._locus_tag:
-                self._cds_by_locus[cds._locus_tag] = cds
-            if cds._gene:
-                self._cds_by_gene[cds._gene] = cds
-            if cds._protein_id:
-                self._cds_by_protein[cds._protein_id] = cds
+    ncbi_tax_id: int | None = None
+    organism: str | None = None
+    modules: list["aSModule"] = field(default_factory=list)
+    _cds_by_name: dict[str, CDS] = field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # hoisted out of the loop so the index build is pure LOAD_FAST territory
+        add_name = self._cds_by_name.setdefault
+        for cds in self.cdses:
+            for key in (cds.locus_tag, cds.gene, cds.protein_id):
+                if key:
+                    add_name(key, cds)
 
     def get_cds(self, name: str) -> CDS | None:
-        return self._cds_by_locus.get(name) or self._cds_by_gene.get(name) or self._cds_by_protein.get(name)
+        return self._cds_by_name.get(name)
 
     def has_cds(self, name: str) -> bool:
-        return self.get_cds(name) is not None
+        return name in self._cds_by_name
 
     @classmethod
-    def from_biopython(cls, record: SeqRecord) -> Self:
+    def from_biopython(cls, record: "SeqRecord") -> Self:
         if not record.id:
             raise MibigError("Record ID is required")
 
         ncbi_tax_id = None
         organism = None
         cdses = []
-        domains = []
+        modules = []
 
         for feature in record.features:
             if feature.type == "source":
@@ -124,29 +121,35 @@ class Record:
                             ncbi_tax_id = int(db_xref.split(":")[1])
 
             if feature.type == "CDS":
-                locus_tag = feature.qualifiers.get("locus_tag", [None])[0]
-                gene = feature.qualifiers.get("gene", [None])[0]
-                protein_id = feature.qualifiers.get("protein_id", [None])[0]
-                translation = feature.qualifiers.get("translation", [None])[0]
-                nrps_pks = feature.qualifiers.get("NRPS_PKS", [None])[0]
-                product = feature.qualifiers.get("product", [None])[0]
-                location = feature.location
-                print(location)
-
-                cdses.append(CDS(locus_tag=locus_tag, gene=gene, protein_id=protein_id, translation=translation,
-                             nrps_pks=nrps_pks, product=product))
+                qualifiers = feature.qualifiers
+                logger.debug("location=%s", feature.location)
+
+                cdses.append(CDS(locus_tag=_first(qualifiers, "locus_tag"),
+                             gene=_first(qualifiers, "gene"),
+                             protein_id=_first(qualifiers, "protein_id"),
+                             translation=_first(qualifiers, "translation"),
+                             nrps_pks=_first(qualifiers, "NRPS_PKS"),
+                             product=_first(qualifiers, "product")))
             
             if feature.type == "aSDomain":
-                domains = feature.qualifiers["domain"]
+                # deferred import, only GenBank loading needs the module classes
+                from mibig.utils_modules import aSModule
+
+                # copy the qualifier list instead of aliasing Biopython's internals
+                domains = list(feature.qualifiers["domain"])
                 locus_tag = feature.qualifiers["locus_tag"][0]
-                starterModule = True if "starterModule" in feature.qualifiers else False
-                final_module = True if "finalModule" in feature.qualifiers else False
+                starterModule = "starterModule" in feature.qualifiers
+                final_module = "finalModule" in feature.qualifiers
 
-                domains.append(aSModule(domains=domains, locus_tag=locus_tag, starterModule=starterModule,
-                                    final_module=final_module))
+                modules.append(aSModule(domains=domains, locus_tag=locus_tag,
+                                    starterModule=starterModule, final_module=final_module))
 
-        return cls(id=record.id, cdses=cdses, seq_len=len(record.seq), ncbi_tax_id=ncbi_tax_id, organism=organism)
+        return cls(id=record.id, cdses=cdses, seq_len=len(record.seq), ncbi_tax_id=ncbi_tax_id,
+                   organism=organism, modules=modules)
 
 
 def load_records(filepath: str) -> list[Record]:
+    # deferred so JSON-only workflows don't pay the Biopython import cost
+    from helperlibs.bio import seqio
+
     return [Record.from_biopython(record) for record in seqio.parse(filepath)]
@@ -1,19 +1,17 @@
+from dataclasses import dataclass
+
 from mibig.errors import MibigError
 
+@dataclass(slots=True, eq=False)
 class aSModule:
-    def __init__(self, domains: list[str] = None, \
-                 locus_tag: str = None, \
-                 starterModule: bool | None = None, \
-                 final_module: bool | None = None, \
-                 locations: list[int] | None = None, \
-                 ):
-        if not all([domains, locus_tag]):
+    domains: list[str] | None = None
+    locus_tag: str | None = None
+    starterModule: bool | None = None
+    final_module: bool | None = None
+    location: list[int] | None = None
+
+    def __post_init__(self) -> None:
+        if not all([self.domains, self.locus_tag]):
             raise MibigError("Domain list and locus tag are required")
-        if not (location is None or len(location) == 2):
+        if not (self.location is None or len(self.location) == 2):
             raise MibigError("Location should be a list of two integers")
-
-        self.domains = domains
-        self.locus_tag = locus_tag
-        self.starterModule = starterModule
-        self.final_module = final_module
-        self.location = location
@@ -57,6 +57,7 @@ setup(
         'Operating System :: OS Independent',
     ],
     extras_require={
+        'fast-json': ['orjson'],
         'testing': tests_require,
     },
 )
@@ -0,0 +1,58 @@
+import importlib
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from mibig.converters.shared.mibig import entry
+from mibig.errors import ValidationError
+
+RAW_ENTRY = {
+    "accession": "BGC0000001",
+    "version": 1,
+    "changelog": {"releases": []},
+    "quality": "questionable",
+    "status": "active",
+    "completeness": "complete",
+    "loci": [],
+    "biosynthesis": {"classes": [{"class": "other", "subclass": "ectoine"}]},
+    "compounds": [],
+    "taxonomy": {"name": "Escherichia coli", "ncbiTaxId": 562},
+}
+
+
+class TestLoadEntry(unittest.TestCase):
+    def test_load_entry_json(self):
+        for data in (json.dumps(RAW_ENTRY), json.dumps(RAW_ENTRY).encode()):
+            loaded = entry.load_entry_json(data)
+
+            assert loaded.accession == "BGC0000001"
+            assert loaded.accession_version == "BGC0000001.1"
+
+    def test_load_entry_json_invalid(self):
+        raw = dict(RAW_ENTRY)
+        raw["accession"] = "Bob"
+
+        with self.assertRaises(ValidationError):
+            entry.load_entry_json(json.dumps(raw))
+
+    def test_load_entry(self):
+        handle = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+        try:
+            json.dump(RAW_ENTRY, handle)
+            handle.close()
+            loaded = entry.load_entry(handle.name)
+
+            assert loaded.accession == "BGC0000001"
+        finally:
+            os.unlink(handle.name)
+
+    def test_stdlib_fallback(self):
+        # blocking orjson forces the import fallback onto the stdlib parser
+        with mock.patch.dict(sys.modules, {"orjson": None}):
+            reloaded = importlib.reload(entry)
+            assert reloaded._loads is json.loads
+
+        importlib.reload(entry)
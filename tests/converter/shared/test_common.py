@@ -3,6 +3,30 @@ import unittest
 
 from mibig.errors import ValidationError
 from mibig.converters.shared import common
+from mibig.utils import CDS, Record
+
+
+class TestGeneId(unittest.TestCase):
+    def test_validate_successive_records(self):
+        gene_id = common.GeneId("geneA", validate=False)
+
+        record = Record("r1", [CDS(locus_tag="geneB")], 100)
+        assert gene_id.validate(record=record)
+        del record
+
+        # a fresh record containing the gene must not inherit the old verdict
+        record = Record("r2", [CDS(locus_tag="geneA")], 100)
+        assert gene_id.validate(record=record) == []
+
+    def test_validate_memo(self):
+        gene_id = common.GeneId("geneA", validate=False)
+        record = Record("r1", [CDS(locus_tag="geneB")], 100)
+
+        memo = {}
+        errors = gene_id.validate(record=record, _validate_memo=memo)
+        assert errors
+        assert memo
+        assert gene_id.validate(record=record, _validate_memo=memo) == errors
 
 
 class TestCitation(unittest.TestCase):